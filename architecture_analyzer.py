@@ -15,19 +15,118 @@ import signal
 import tempfile
 import atexit
 import time
+import pickle
+import hashlib
+import mmap
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import partial
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from typing import Callable, Dict, Iterator, List, Optional, Any
 from dataclasses import dataclass, asdict
 from datetime import datetime
-from rich.console import Console
-from rich.table import Table
-from rich.tree import Tree
-from rich.panel import Panel
-from rich.text import Text
+
+# Optional fast JSON encoder; exports fall back to the stdlib json module without it
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Prefer the libyaml-backed loader; fall back to pure Python when PyYAML was built without it
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+
+# Patterns used for every analyzed file, compiled once at import
+_FRONTMATTER_RE = re.compile(r'^---\s*\n(.*?)\n---\s*\n', re.DOTALL)
+# Only scans leading whitespace, unlike content.strip() which copies the whole file
+_FRONTMATTER_START_RE = re.compile(r'\s*---')
+_HEADER_RE = re.compile(r'^##[^\S\n]+(.*)', re.MULTILINE)
+
+# Front matter sits at the top of the file, so a small probe read usually covers it
+_PROBE_SIZE = 4096
+_FRONTMATTER_BYTES_RE = re.compile(rb'^---\s*\n(.*?)\n---\s*\n', re.DOTALL)
+
+# Files at least this large are memory-mapped and scanned as bytes, decoding only matches
+_MMAP_THRESHOLD = 64 * 1024
+# Bytes that make byte patterns disagree with the str ones: CR needs newline translation,
+# \x1c-\x1f and non-ASCII text may be whitespace to str \s, and non-ASCII may be invalid UTF-8
+_TEXT_PATH_BYTES_RE = re.compile(rb'[\r\x1c-\x1f\x80-\xff]')
+_FRONTMATTER_START_BYTES_RE = re.compile(rb'\s*---')
+_HEADER_BYTES_RE = re.compile(rb'^##[^\S\n]+(.*)', re.MULTILINE)
+
+def _decode_text(data: bytes) -> str:
+    """Decode UTF-8 bytes with the newline translation of text-mode open()."""
+    text = data.decode('utf-8')
+    if '\r' in text:
+        text = text.replace('\r\n', '\n').replace('\r', '\n')
+    return text
+
+def _walk_md(root: str, recursive: bool = True) -> Iterator[str]:
+    """Yield paths of markdown files under root with an iterative os.scandir walk.
+    
+    Entry types come from readdir, so no extra stat is needed per entry; like
+    Path.rglob, symlinked directories are not descended into.
+    """
+    stack = [root]
+    while stack:
+        directory = stack.pop()
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        if recursive:
+                            stack.append(entry.path)
+                    elif entry.name.endswith('.md'):
+                        yield entry.path
+        except OSError:
+            continue
+
+def _compile_field_validator(fields: tuple) -> Callable[[Any], List[str]]:
+    """Generate a validator with one inlined .get() check per required field.
+    
+    The field tuple is fixed, so the generated function has no loop; for
+    ('phase', 'step') it is equivalent to:
+    
+        def validate(yaml_data):
+            if not yaml_data or not isinstance(yaml_data, dict):
+                return ['phase', 'step']
+            get = yaml_data.get
+            missing = []
+            if get('phase') is None: missing.append('phase')
+            if get('step') is None: missing.append('step')
+            return missing
+    """
+    lines = [
+        "def validate(yaml_data):",
+        "    if not yaml_data or not isinstance(yaml_data, dict):",
+        f"        return {list(fields)!r}",
+        "    get = yaml_data.get",
+        "    missing = []",
+    ]
+    lines.extend(f"    if get({field!r}) is None: missing.append({field!r})" for field in fields)
+    lines.append("    return missing")
+    
+    namespace: Dict[str, Any] = {}
+    exec("\n".join(lines), namespace)
+    return namespace["validate"]
+
+def _count_md(directory: str) -> int:
+    """Count markdown files directly inside directory without building a list."""
+    try:
+        with os.scandir(directory) as entries:
+            return sum(1 for entry in entries if not entry.is_dir() and entry.name.endswith('.md'))
+    except OSError:
+        return 0
 
 @dataclass
 class FileAnalysis:
     """Data class to store file analysis results."""
+    # Declared by hand rather than dataclass(slots=True) to keep Python 3.9 support
+    __slots__ = ('filename', 'filepath', 'yaml_frontmatter', 'headers', 'yaml_valid',
+                 'yaml_errors', 'missing_required_fields')
+    
     filename: str
     filepath: str
     yaml_frontmatter: Optional[Dict[str, Any]]
@@ -36,90 +135,191 @@ class FileAnalysis:
     yaml_errors: List[str]
     missing_required_fields: List[str]
 
-class ArchitectureAnalyzer:
-    """Main analyzer class for folder architecture."""
-    
-    # Required YAML fields for validation
-    REQUIRED_YAML_FIELDS = [
-        'phase', 'step', 'task', 'task_id', 'title', 
-        'previous_task', 'next_task', 'version', 'agent', 'orchestrator'
-    ]
+def _default_cache_dir() -> Path:
+    """Directory holding the analyzer's on-disk caches."""
+    return Path(os.environ.get("XDG_CACHE_HOME", Path.home() / ".cache")) / "architecture_analyzer"
+
+class FileCache:
+    """On-disk cache of file analyses keyed by absolute path and invalidated by mtime/size."""
     
-    # Class variable to track temporary files for cleanup
-    _temp_files = []
+    # Bump whenever the analysis output for an unchanged file or the key format would differ
+    VERSION = 2
+    # Least recently used entries beyond this are dropped on save, so files from
+    # trees analyzed long ago, or since deleted, do not pile up in the pickle
+    MAX_ENTRIES = 8192
     
-    def __init__(self, folder_path: str, recursive: bool = False, show_structure: bool = False, 
-                 export_format: Optional[str] = None, output_dir: str = "./exports", export_html: bool = False):
-        """Initialize analyzer with folder path."""
-        self.folder_path = Path(folder_path)
-        self.console = Console()
-        self.files_analysis: List[FileAnalysis] = []
-        self.recursive = recursive
-        self.show_structure = show_structure
-        self.export_format = export_format
-        self.output_dir = Path(output_dir)
-        self.analysis_timestamp = datetime.now()
-        self.export_html = export_html
-        self.temp_html_file = None
-        
-        if not self.folder_path.exists():
-            raise FileNotFoundError(f"Folder not found: {folder_path}")
-        if not self.folder_path.is_dir():
-            raise NotADirectoryError(f"Path is not a directory: {folder_path}")
-        
-        # Create output directory if exporting
-        if self.export_format:
-            self.output_dir.mkdir(parents=True, exist_ok=True)
+    def __init__(self, cache_file: Optional[Path] = None):
+        """Load cached entries from disk, starting empty if missing or stale."""
+        if cache_file is None:
+            cache_file = _default_cache_dir() / "cache.pkl"
+        self.cache_file = cache_file
+        # Ordered from least to most recently used
+        self.entries: Dict[str, tuple] = {}
+        self.dirty = False
         
-        # Setup signal handlers for cleanup
-        if self.export_html:
-            signal.signal(signal.SIGINT, self._signal_handler)
-            signal.signal(signal.SIGTERM, self._signal_handler)
-            atexit.register(self._cleanup_temp_files)
+        try:
+            with open(self.cache_file, 'rb') as f:
+                version, entries = pickle.load(f)
+            if version == self.VERSION:
+                self.entries = entries
+        except Exception:
+            pass
     
-    @classmethod
-    def _cleanup_temp_files(cls):
-        """Clean up temporary files."""
-        for temp_file in cls._temp_files:
-            try:
-                if temp_file.exists():
-                    temp_file.unlink()
-            except Exception:
-                pass
-        cls._temp_files.clear()
+    def lookup(self, file_path: Path) -> tuple[Optional[os.stat_result], Optional[FileAnalysis]]:
+        """Stat file_path and return the stat along with any still-valid cached analysis."""
+        try:
+            stat = os.stat(file_path)
+        except OSError:
+            return None, None
+        return stat, self.get(file_path, stat)
     
-    def _signal_handler(self, signum, frame):
-        """Handle interrupt signals for cleanup."""
-        self.console.print("\n\n🧹 [yellow]Cleaning up temporary files...[/yellow]")
-        self._cleanup_temp_files()
-        self.console.print("✅ [green]Cleanup completed. Goodbye![/green]")
-        sys.exit(0)
+    def get(self, file_path: Path, stat: os.stat_result) -> Optional[FileAnalysis]:
+        """Return the cached analysis if the file is unchanged since it was stored."""
+        key = os.path.abspath(file_path)
+        entry = self.entries.pop(key, None)
+        if entry is None:
+            return None
+        # Move to the most recent end; a hit alone does not force a rewrite of the file
+        self.entries[key] = entry
+        if entry[0] != stat.st_mtime_ns or entry[1] != stat.st_size:
+            return None
+        # The same file may be reached through another spelling of the root; report it as asked for
+        return FileAnalysis(**{**entry[2], 'filename': file_path.name, 'filepath': str(file_path)})
     
-    def export_html_interactive(self) -> str:
-        """Export to HTML file in current directory and return file path."""
-        # Create HTML file in current working directory
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        filename = f"architecture_analysis_{timestamp}.html"
-        temp_file = Path.cwd() / filename
-        
-        # Track for cleanup
-        self.__class__._temp_files.append(temp_file)
-        self.temp_html_file = temp_file
-        
-        # Generate HTML content
-        html_content = self._generate_html_content()
-        
-        # Write to file
-        with open(temp_file, 'w', encoding='utf-8') as f:
-            f.write(html_content)
+    def put(self, file_path: Path, stat: os.stat_result, analysis: FileAnalysis) -> None:
+        """Store an analysis, replacing any stale entry for the same path."""
+        key = os.path.abspath(file_path)
+        self.entries.pop(key, None)
+        self.entries[key] = (stat.st_mtime_ns, stat.st_size, asdict(analysis))
+        self.dirty = True
+    
+    def save(self) -> None:
+        """Evict down to MAX_ENTRIES and write the cache back atomically if anything changed."""
+        if not self.dirty:
+            return
+        if len(self.entries) > self.MAX_ENTRIES:
+            self.entries = dict(list(self.entries.items())[-self.MAX_ENTRIES:])
+        try:
+            self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+            temp_file = self.cache_file.with_suffix('.tmp')
+            with open(temp_file, 'wb') as f:
+                pickle.dump((self.VERSION, self.entries), f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(temp_file, self.cache_file)
+            self.dirty = False
+        except OSError:
+            pass
+
+class ParserCache:
+    """JSON sidecar mapping a front matter content hash to its parsed YAML.
+    
+    Complements FileCache: a file whose mtime changed but whose front matter
+    did not (body edits, fresh checkouts) skips the YAML parser.
+    """
+    
+    VERSION = 1
+    # Least-frequently-used entries beyond this are dropped on save; sized
+    # well above the few hundred task files a workflow tree holds. Counts are
+    # halved on every load so blocks that stopped being used age out.
+    MAX_ENTRIES = 1024
+    
+    def __init__(self, cache_file: Optional[Path] = None):
+        """Load cached entries from disk, starting empty if missing or stale."""
+        if cache_file is None:
+            cache_file = _default_cache_dir() / "yaml_cache.json"
+        self.cache_file = cache_file
+        # Ordered from least to most recently used
+        self.entries: Dict[str, str] = {}
+        self.hits: Dict[str, int] = {}
+        self.dirty = False
         
-        return str(temp_file)
+        try:
+            with open(self.cache_file, 'r', encoding='utf-8') as f:
+                stored = json.load(f)
+            if stored.get("version") == self.VERSION:
+                for digest, entry in stored["entries"].items():
+                    self.entries[digest] = entry["data"]
+                    self.hits[digest] = entry["hits"] // 2
+        except Exception:
+            pass
     
-    def _generate_html_content(self) -> str:
-        """Generate HTML content for export."""
-        export_data = self.get_export_data()
+    @staticmethod
+    def digest(yaml_content: str) -> str:
+        """Hash a front matter block."""
+        return hashlib.blake2b(yaml_content.encode('utf-8'), digest_size=16).hexdigest()
+    
+    def get(self, digest: str) -> Optional[Any]:
+        """Return a fresh copy of the parsed YAML for digest, or None on a miss."""
+        data = self.entries.pop(digest, None)
+        if data is None:
+            return None
+        # Move to the most recent end; hits alone do not force a rewrite of the file
+        self.entries[digest] = data
+        self.hits[digest] = self.hits.get(digest, 0) + 1
+        return json.loads(data)
+    
+    def put(self, digest: str, yaml_data: Any) -> None:
+        """Store parsed YAML, skipping values that would not survive a JSON round trip."""
+        if yaml_data is None:
+            return
+        try:
+            data = json.dumps(yaml_data, ensure_ascii=False)
+        except (TypeError, ValueError):
+            return
+        if json.loads(data) != yaml_data:
+            return
+        self.entries.pop(digest, None)
+        self.entries[digest] = data
+        self.hits[digest] = self.hits.get(digest, 0) + 1
+        self.dirty = True
+    
+    def save(self) -> None:
+        """Evict down to MAX_ENTRIES by hit count and write the cache atomically.
         
-        html_content = f"""<!DOCTYPE html>
+        Only runs that stored new entries write; ties in hit count are broken
+        in favour of the more recently used entry.
+        """
+        if not self.dirty:
+            return
+        # Most recent first, so the stable sort keeps newer entries among equal counts
+        kept = sorted(reversed(list(self.entries)), key=lambda digest: self.hits.get(digest, 0),
+                      reverse=True)[:self.MAX_ENTRIES]
+        stored = {
+            "version": self.VERSION,
+            # Written least relevant first to restore the recency order on load
+            "entries": {digest: {"data": self.entries[digest], "hits": self.hits.get(digest, 0)}
+                        for digest in reversed(kept)}
+        }
+        try:
+            self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+            temp_file = self.cache_file.with_suffix('.tmp')
+            with open(temp_file, 'w', encoding='utf-8') as f:
+                json.dump(stored, f, ensure_ascii=False)
+            os.replace(temp_file, self.cache_file)
+            self.dirty = False
+        except OSError:
+            pass
+
+def _analyze_file_worker(file_path: Path, cache: Optional[FileCache] = None,
+                         parser_cache: Optional[ParserCache] = None, headers: bool = True) -> FileAnalysis:
+    """Analyze a single file; module-level so it can be handed to an executor."""
+    return ArchitectureAnalyzer.analyze_file(file_path, cache, headers, parser_cache)
+
+# Same replacements as html.escape(), applied in one C-level pass per value
+_HTML_ESCAPE = str.maketrans({'&': '&amp;', '<': '&lt;', '>': '&gt;', '"': '&quot;', "'": '&#x27;'})
+
+# The Rich style tags used in status lines, stripped when printing without Rich
+_MARKUP_RE = re.compile(r'\[/?(?:bold|dim|red|green|yellow|cyan)\]')
+
+# Display strings indexed by a bool (False, True), e.g. _ICON[analysis.yaml_valid]
+_ICON = ("❌", "✅")
+_STATUS = ("❌ Issues", "✅ Valid")
+_FIELD_ICON = ("ℹ️", "✅")
+_HTML_STATUS_CLASS = ("invalid", "valid")
+_HTML_STATUS = ("❌ Invalid", "✅ Valid")
+_HTML_VALID_TEXT = ("❌ No", "✅ Yes")
+
+# Static parts of the interactive report, filled with str.format per export
+_INTERACTIVE_HTML_HEAD = """<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
@@ -164,18 +364,18 @@ class ArchitectureAnalyzer:
         
         <div class="metadata">
             <h2>📋 Analysis Metadata</h2>
-            <p><strong>Timestamp:</strong> {export_data['analysis_metadata']['timestamp']}</p>
-            <p><strong>Folder Path:</strong> {export_data['analysis_metadata']['folder_path']}</p>
-            <p><strong>Recursive Analysis:</strong> {export_data['analysis_metadata']['recursive']}</p>
-            <p><strong>Total Files:</strong> {export_data['analysis_metadata']['total_files']}</p>
+            <p><strong>Timestamp:</strong> {timestamp}</p>
+            <p><strong>Folder Path:</strong> {folder_path}</p>
+            <p><strong>Recursive Analysis:</strong> {recursive}</p>
+            <p><strong>Total Files:</strong> {total_files}</p>
         </div>
         
         <div class="summary">
             <h2>📈 Summary</h2>
-            <p><strong>Valid Files:</strong> <span class="valid">{export_data['analysis_metadata']['valid_files']}</span></p>
-            <p><strong>Invalid Files:</strong> <span class="invalid">{export_data['analysis_metadata']['invalid_files']}</span></p>
-            <p><strong>Success Rate:</strong> {(export_data['analysis_metadata']['valid_files']/export_data['analysis_metadata']['total_files']*100):.1f}%</p>
-            <p><strong>Total Headers:</strong> {sum(len(file['headers']) for file in export_data['files'])}</p>
+            <p><strong>Valid Files:</strong> <span class="valid">{valid_files}</span></p>
+            <p><strong>Invalid Files:</strong> <span class="invalid">{invalid_files}</span></p>
+            <p><strong>Success Rate:</strong> {success_rate:.1f}%</p>
+            <p><strong>Total Headers:</strong> {total_headers}</p>
         </div>
         
         <h2>📁 Files Analysis</h2>
@@ -190,134 +390,389 @@ class ArchitectureAnalyzer:
                 </tr>
             </thead>
             <tbody>"""
-        
-        for file_data in export_data['files']:
-            status_class = "valid" if file_data['yaml_valid'] else "invalid"
-            status_icon = "✅ Valid" if file_data['yaml_valid'] else "❌ Invalid"
-            
-            html_content += f"""
+
+_SUMMARY_ROW_HTML = """
                 <tr>
-                    <td>{file_data['filename']}</td>
+                    <td>{filename}</td>
                     <td class="{status_class}">{status_icon}</td>
-                    <td>{len(file_data['headers'])}</td>
-                    <td>{len(file_data['missing_required_fields'])}</td>
-                    <td>{len(file_data['yaml_errors'])}</td>
+                    <td>{headers}</td>
+                    <td>{missing}</td>
+                    <td>{errors}</td>
                 </tr>"""
+
+_INTERACTIVE_HTML_TAIL = """
+        <div class="timestamp">
+            Generated at: {generated_at}
+        </div>
+    </div>
+</body>
+</html>"""
+
+# Emitted verbatim (not formatted), so its CSS braces are not doubled
+_WORKFLOW_HTML_HEAD = """
+        <div class="workflow-container">
+            <div class="workflow-legend">
+                <h3>🗺️ Task Flow Diagram</h3>
+                <p>Shows the dependency relationships between tasks based on <code>previous_task</code> and <code>next_task</code> fields.</p>
+            </div>
+            <style>
+                .workflow-container { margin-bottom: 30px; }
+                .workflow-legend { background: #e8f4fd; padding: 15px; border-radius: 8px; margin-bottom: 20px; border-left: 4px solid #3498db; }
+                .workflow-diagram { background: white; border: 2px solid #ddd; border-radius: 10px; padding: 20px; overflow-x: auto; }
+                .workflow-phase { margin-bottom: 25px; }
+                .phase-header { background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); color: white; padding: 10px 15px; border-radius: 6px; font-weight: bold; margin-bottom: 15px; }
+                .task-flow { display: flex; flex-wrap: wrap; gap: 15px; align-items: center; margin-bottom: 10px; }
+                .task-node { background: #f8f9fa; border: 2px solid #dee2e6; border-radius: 8px; padding: 10px 15px; min-width: 200px; text-align: center; position: relative; }
+                .task-node.valid { border-color: #28a745; background: #d4edda; }
+                .task-node.invalid { border-color: #dc3545; background: #f8d7da; }
+                .task-id { font-weight: bold; color: #495057; }
+                .task-title { font-size: 0.9em; color: #6c757d; margin-top: 5px; }
+                .task-agent { font-size: 0.8em; color: #007bff; margin-top: 3px; }
+                .flow-arrow { font-size: 1.5em; color: #6c757d; margin: 0 10px; }
+                .orphan-tasks { margin-top: 20px; }
+                .orphan-header { background: #ffc107; color: #212529; padding: 8px 12px; border-radius: 6px; font-weight: bold; margin-bottom: 10px; }
+                .workflow-stats { background: #f8f9fa; padding: 15px; border-radius: 8px; margin-top: 20px; }
+                .stats-grid { display: grid; grid-template-columns: repeat(auto-fit, minmax(150px, 1fr)); gap: 15px; }
+                .stat-item { text-align: center; }
+                .stat-number { font-size: 1.5em; font-weight: bold; color: #495057; }
+                .stat-label { font-size: 0.9em; color: #6c757d; }
+            </style>
+            <div class="workflow-diagram">"""
+
+_WORKFLOW_STATS_HTML = """
+                <div class="workflow-stats">
+                    <h4>📊 Workflow Statistics</h4>
+                    <div class="stats-grid">
+                        <div class="stat-item">
+                            <div class="stat-number">{total_tasks}</div>
+                            <div class="stat-label">Total Tasks</div>
+                        </div>
+                        <div class="stat-item">
+                            <div class="stat-number">{connected_tasks}</div>
+                            <div class="stat-label">Connected Tasks</div>
+                        </div>
+                        <div class="stat-item">
+                            <div class="stat-number">{orphaned_tasks}</div>
+                            <div class="stat-label">Orphaned Tasks</div>
+                        </div>
+                        <div class="stat-item">
+                            <div class="stat-number">{phases_count}</div>
+                            <div class="stat-label">Phases</div>
+                        </div>
+                        <div class="stat-item">
+                            <div class="stat-number">{valid_tasks}</div>
+                            <div class="stat-label">Valid Tasks</div>
+                        </div>
+                        <div class="stat-item">
+                            <div class="stat-number">{completion_rate:.1f}%</div>
+                            <div class="stat-label">Completion Rate</div>
+                        </div>
+                    </div>
+                </div>
+            </div>
+        </div>"""
+
+# Static parts of the exported HTML report, filled with str.format per export
+_REPORT_HTML_HEAD = """<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>Architecture Analysis Report</title>
+    <style>
+        body {{ font-family: Arial, sans-serif; margin: 20px; background-color: #f5f5f5; }}
+        .container {{ max-width: 1200px; margin: 0 auto; background: white; padding: 20px; border-radius: 8px; box-shadow: 0 2px 10px rgba(0,0,0,0.1); }}
+        h1, h2, h3 {{ color: #333; }}
+        .metadata {{ background: #e8f4fd; padding: 15px; border-radius: 5px; margin-bottom: 20px; }}
+        .summary {{ background: #f0f8f0; padding: 15px; border-radius: 5px; margin-bottom: 20px; }}
+        table {{ width: 100%; border-collapse: collapse; margin-bottom: 20px; }}
+        th, td {{ border: 1px solid #ddd; padding: 8px; text-align: left; }}
+        th {{ background-color: #f2f2f2; font-weight: bold; }}
+        .valid {{ color: #28a745; }}
+        .invalid {{ color: #dc3545; }}
+        .file-details {{ margin-bottom: 20px; padding: 15px; border: 1px solid #ddd; border-radius: 5px; }}
+        .headers {{ background: #fff3cd; padding: 10px; border-radius: 3px; }}
+        .errors {{ background: #f8d7da; padding: 10px; border-radius: 3px; }}
+        .missing {{ background: #f8d7da; padding: 10px; border-radius: 3px; }}
+    </style>
+</head>
+<body>
+    <div class="container">
+        <h1>📊 Architecture Analysis Report</h1>
+        
+        <div class="metadata">
+            <h2>📋 Analysis Metadata</h2>
+            <p><strong>Timestamp:</strong> {timestamp}</p>
+            <p><strong>Folder Path:</strong> {folder_path}</p>
+            <p><strong>Recursive Analysis:</strong> {recursive}</p>
+            <p><strong>Total Files:</strong> {total_files}</p>
+        </div>
+        
+        <div class="summary">
+            <h2>📈 Summary</h2>
+            <p><strong>Valid Files:</strong> <span class="valid">{valid_files}</span></p>
+            <p><strong>Invalid Files:</strong> <span class="invalid">{invalid_files}</span></p>
+            <p><strong>Success Rate:</strong> {success_rate:.1f}%</p>
+            <p><strong>Total Headers:</strong> {total_headers}</p>
+        </div>
+        
+        <h2>📁 Files Analysis</h2>
+        <table>
+            <thead>
+                <tr>
+                    <th>File</th>
+                    <th>Status</th>
+                    <th>Headers</th>
+                    <th>Missing Fields</th>
+                    <th>Errors</th>
+                </tr>
+            </thead>
+            <tbody>"""
+
+_REPORT_DETAILS_HEAD = """
+            </tbody>
+        </table>
+        
+        <h2>📝 Detailed File Analysis</h2>"""
+
+_REPORT_FILE_HTML = """
+        <div class="file-details">
+            <h3>📄 {filename}</h3>
+            <p><strong>Path:</strong> {filepath}</p>
+            <p><strong>YAML Valid:</strong> <span class="{status_class}">{status_text}</span></p>"""
+
+_REPORT_LIST_HTML = """
+            <div class="{css_class}">
+                <h4>{title} ({count})</h4>
+                <ul>{items}</ul>
+            </div>"""
+
+_REPORT_HTML_TAIL = """
+    </div>
+</body>
+</html>"""
+
+class ArchitectureAnalyzer:
+    """Main analyzer class for folder architecture."""
+    
+    # Required YAML fields for validation
+    REQUIRED_YAML_FIELDS = (
+        'phase', 'step', 'task', 'task_id', 'title', 
+        'previous_task', 'next_task', 'version', 'agent', 'orchestrator'
+    )
+    # The tuple fixes the order of missing fields in reports; membership tests use the set
+    _REQUIRED_SET = frozenset(REQUIRED_YAML_FIELDS)
+    _validate_required = staticmethod(_compile_field_validator(REQUIRED_YAML_FIELDS))
+    
+    # Class variable to track temporary files for cleanup
+    _temp_files = []
+    
+    def __init__(self, folder_path: str, recursive: bool = False, show_structure: bool = False, 
+                 export_format: Optional[str] = None, output_dir: str = "./exports", export_html: bool = False,
+                 use_cache: bool = True, workers: Optional[int] = None, use_processes: bool = False,
+                 verbose: bool = False, pretty_json: bool = False, include_headers: bool = True):
+        """Initialize analyzer with folder path."""
+        self.folder_path = Path(folder_path)
+        self._console = None
+        self.files_analysis: List[FileAnalysis] = []
+        self._export_data: Dict[bool, Dict[str, Any]] = {}
+        self.recursive = recursive
+        self.show_structure = show_structure
+        self.export_format = export_format
+        self.output_dir = Path(output_dir)
+        self.analysis_timestamp = datetime.now()
+        # Shared by every export file name of this run
+        self._ts_str = self.analysis_timestamp.strftime("%Y%m%d_%H%M%S")
+        self.export_html = export_html
+        self.temp_html_file = None
+        self._opener = None
+        self.file_cache = FileCache() if use_cache else None
+        self.parser_cache = ParserCache() if use_cache else None
+        self.workers = workers
+        self.use_processes = use_processes
+        self.verbose = verbose
+        self.pretty_json = pretty_json
+        self.include_headers = include_headers
+        self._is_tty = sys.stdout.isatty()
+        # Export-only runs without a terminal print plain status lines and never import Rich
+        self._headless = bool(export_format) and not export_html and not verbose and not self._is_tty
         
-        html_content += """
+        if not self.folder_path.exists():
+            raise FileNotFoundError(f"Folder not found: {folder_path}")
+        if not self.folder_path.is_dir():
+            raise NotADirectoryError(f"Path is not a directory: {folder_path}")
+        
+        # Create output directory if exporting
+        if self.export_format:
+            self.output_dir.mkdir(parents=True, exist_ok=True)
+        
+        # Setup signal handlers for cleanup
+        if self.export_html:
+            signal.signal(signal.SIGINT, self._signal_handler)
+            signal.signal(signal.SIGTERM, self._signal_handler)
+            atexit.register(self._cleanup_temp_files)
+    
+    @property
+    def console(self):
+        """Rich console, created on first use so Rich is only imported when printing."""
+        if self._console is None:
+            from rich.console import Console
+            self._console = Console()
+        return self._console
+    
+    def _print_status(self, message: str) -> None:
+        """Print a status line through Rich, or as plain text on headless export runs."""
+        if self._headless:
+            print(_MARKUP_RE.sub('', message))
+        else:
+            self.console.print(message)
+    
+    @classmethod
+    def _cleanup_temp_files(cls):
+        """Clean up temporary files."""
+        for temp_file in cls._temp_files:
+            try:
+                if temp_file.exists():
+                    temp_file.unlink()
+            except Exception:
+                pass
+        cls._temp_files.clear()
+    
+    def _reap_opener(self, signum=None, frame=None):
+        """Collect the browser launcher once it has exited."""
+        if self._opener is not None and self._opener.poll() is not None:
+            self._opener = None
+    
+    def _signal_handler(self, signum, frame):
+        """Handle interrupt signals for cleanup."""
+        self.console.print("\n\n🧹 [yellow]Cleaning up temporary files...[/yellow]")
+        self._reap_opener()
+        self._cleanup_temp_files()
+        self.console.print("✅ [green]Cleanup completed. Goodbye![/green]")
+        sys.exit(0)
+    
+    def export_html_interactive(self) -> str:
+        """Export to HTML file in current directory and return file path."""
+        # Create HTML file in current working directory
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        filename = f"architecture_analysis_{timestamp}.html"
+        temp_file = Path.cwd() / filename
+        
+        # Track for cleanup
+        self.__class__._temp_files.append(temp_file)
+        self.temp_html_file = temp_file
+        
+        # Stream HTML content straight to a buffered binary file, encoding each chunk once
+        with open(temp_file, 'wb', buffering=1024 * 1024) as f:
+            f.writelines(chunk.encode('utf-8') for chunk in self._iter_html_content())
+        
+        return str(temp_file)
+    
+    def _iter_html_content(self) -> Iterator[str]:
+        """Generate HTML content for export as a stream of chunks."""
+        export_data = self.get_export_data()
+        
+        metadata = export_data['analysis_metadata']
+        yield _INTERACTIVE_HTML_HEAD.format(
+            timestamp=metadata['timestamp'],
+            folder_path=metadata['folder_path'].translate(_HTML_ESCAPE),
+            recursive=metadata['recursive'],
+            total_files=metadata['total_files'],
+            valid_files=metadata['valid_files'],
+            invalid_files=metadata['invalid_files'],
+            success_rate=metadata['valid_files'] / metadata['total_files'] * 100,
+            total_headers=export_data['summary']['total_headers']
+        )
+        
+        yield "".join(
+            _SUMMARY_ROW_HTML.format(
+                filename=file_data['filename'].translate(_HTML_ESCAPE),
+                status_class=_HTML_STATUS_CLASS[file_data['yaml_valid']],
+                status_icon=_HTML_STATUS[file_data['yaml_valid']],
+                headers=len(file_data['headers']),
+                missing=len(file_data['missing_required_fields']),
+                errors=len(file_data['yaml_errors'])
+            )
+            for file_data in export_data['files']
+        )
+        
+        yield """
             </tbody>
         </table>
         
         <h2>🔄 Workflow Dependency Schema</h2>"""
         
         # Generate workflow dependency diagram
-        workflow_html = self._generate_workflow_schema_html(export_data['files'])
-        html_content += workflow_html
+        yield from self._iter_workflow_schema_html(export_data['files'])
         
-        html_content += """
+        yield """
         <h2>📝 Detailed File Analysis</h2>"""
         
-        # Add detailed analysis for each file
+        # Add detailed analysis for each file, rendered as one template per file
         for file_data in export_data['files']:
-            status_class = "valid" if file_data['yaml_valid'] else "invalid"
-            status_icon = "✅ Valid" if file_data['yaml_valid'] else "❌ Invalid"
-            
-            html_content += f"""
-        <div class="file-details">
-            <h3>📄 {file_data['filename']}</h3>
-            <p><strong>Path:</strong> {file_data['filepath']}</p>
-            <p><strong>YAML Valid:</strong> <span class="{status_class}">{status_icon}</span></p>"""
+            status_class = _HTML_STATUS_CLASS[file_data['yaml_valid']]
+            status_icon = _HTML_STATUS[file_data['yaml_valid']]
             
             # Add YAML front matter details
+            yaml_block = ""
             if file_data['yaml_frontmatter']:
-                html_content += """
+                yaml_items = "".join(
+                    f"<li>{_FIELD_ICON[key in self._REQUIRED_SET]} <strong>{str(key).translate(_HTML_ESCAPE)}:</strong> {str(value).translate(_HTML_ESCAPE)}</li>"
+                    for key, value in file_data['yaml_frontmatter'].items()
+                )
+                yaml_block = f"""
             <div class="headers">
                 <h4>📋 YAML Front Matter</h4>
-                <ul>"""
-                for key, value in file_data['yaml_frontmatter'].items():
-                    is_required = key in export_data['summary']['required_yaml_fields']
-                    field_status = "✅" if is_required else "ℹ️"
-                    html_content += f"<li>{field_status} <strong>{key}:</strong> {value}</li>"
-                html_content += "</ul></div>"
+                <ul>{yaml_items}</ul></div>"""
             
             # Add headers
             if file_data['headers']:
-                html_content += f"""
+                headers_block = f"""
             <div class="headers">
                 <h4>📝 Headers ({len(file_data['headers'])})</h4>
-                <ul>{''.join(f'<li>• {header}</li>' for header in file_data['headers'])}</ul>
+                <ul>{''.join(f'<li>• {header.translate(_HTML_ESCAPE)}</li>' for header in file_data['headers'])}</ul>
             </div>"""
             else:
-                html_content += "<p>No headers found</p>"
+                headers_block = "<p>No headers found</p>"
             
             # Add missing fields
+            missing_block = ""
             if file_data['missing_required_fields']:
-                html_content += f"""
+                missing_block = f"""
             <div class="missing">
                 <h4>❌ Missing Required Fields ({len(file_data['missing_required_fields'])})</h4>
-                <ul>{''.join(f'<li>{field}</li>' for field in file_data['missing_required_fields'])}</ul>
+                <ul>{''.join(f'<li>{field.translate(_HTML_ESCAPE)}</li>' for field in file_data['missing_required_fields'])}</ul>
             </div>"""
             
             # Add YAML errors
+            errors_block = ""
             if file_data['yaml_errors']:
-                html_content += f"""
+                errors_block = f"""
             <div class="errors">
                 <h4>⚠️ YAML Errors ({len(file_data['yaml_errors'])})</h4>
-                <ul>{''.join(f'<li>{error}</li>' for error in file_data['yaml_errors'])}</ul>
+                <ul>{''.join(f'<li>{error.translate(_HTML_ESCAPE)}</li>' for error in file_data['yaml_errors'])}</ul>
             </div>"""
             
-            html_content += "</div>"
-        
-        html_content += """
-        <div class="timestamp">
-            Generated at: """ + datetime.now().strftime("%Y-%m-%d %H:%M:%S") + """
-        </div>
-    </div>
-</body>
-</html>"""
+            yield f"""
+        <div class="file-details">
+            <h3>📄 {file_data['filename'].translate(_HTML_ESCAPE)}</h3>
+            <p><strong>Path:</strong> {file_data['filepath'].translate(_HTML_ESCAPE)}</p>
+            <p><strong>YAML Valid:</strong> <span class="{status_class}">{status_icon}</span></p>{yaml_block}{headers_block}{missing_block}{errors_block}</div>"""
         
-        return html_content
+        yield _INTERACTIVE_HTML_TAIL.format(generated_at=datetime.now().strftime("%Y-%m-%d %H:%M:%S"))
     
-    def _generate_workflow_schema_html(self, files_data: List[Dict]) -> str:
-        """Generate HTML for workflow dependency schema."""
-        workflow_html = """
-        <div class="workflow-container">
-            <div class="workflow-legend">
-                <h3>🗺️ Task Flow Diagram</h3>
-                <p>Shows the dependency relationships between tasks based on <code>previous_task</code> and <code>next_task</code> fields.</p>
-            </div>
-            <style>
-                .workflow-container { margin-bottom: 30px; }
-                .workflow-legend { background: #e8f4fd; padding: 15px; border-radius: 8px; margin-bottom: 20px; border-left: 4px solid #3498db; }
-                .workflow-diagram { background: white; border: 2px solid #ddd; border-radius: 10px; padding: 20px; overflow-x: auto; }
-                .workflow-phase { margin-bottom: 25px; }
-                .phase-header { background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); color: white; padding: 10px 15px; border-radius: 6px; font-weight: bold; margin-bottom: 15px; }
-                .task-flow { display: flex; flex-wrap: wrap; gap: 15px; align-items: center; margin-bottom: 10px; }
-                .task-node { background: #f8f9fa; border: 2px solid #dee2e6; border-radius: 8px; padding: 10px 15px; min-width: 200px; text-align: center; position: relative; }
-                .task-node.valid { border-color: #28a745; background: #d4edda; }
-                .task-node.invalid { border-color: #dc3545; background: #f8d7da; }
-                .task-id { font-weight: bold; color: #495057; }
-                .task-title { font-size: 0.9em; color: #6c757d; margin-top: 5px; }
-                .task-agent { font-size: 0.8em; color: #007bff; margin-top: 3px; }
-                .flow-arrow { font-size: 1.5em; color: #6c757d; margin: 0 10px; }
-                .orphan-tasks { margin-top: 20px; }
-                .orphan-header { background: #ffc107; color: #212529; padding: 8px 12px; border-radius: 6px; font-weight: bold; margin-bottom: 10px; }
-                .workflow-stats { background: #f8f9fa; padding: 15px; border-radius: 8px; margin-top: 20px; }
-                .stats-grid { display: grid; grid-template-columns: repeat(auto-fit, minmax(150px, 1fr)); gap: 15px; }
-                .stat-item { text-align: center; }
-                .stat-number { font-size: 1.5em; font-weight: bold; color: #495057; }
-                .stat-label { font-size: 0.9em; color: #6c757d; }
-            </style>
-            <div class="workflow-diagram">"""
+    def _iter_workflow_schema_html(self, files_data: List[Dict]) -> Iterator[str]:
+        """Generate HTML for workflow dependency schema as a stream of chunks."""
+        yield _WORKFLOW_HTML_HEAD
         
         # Build workflow data structure
         workflow_data = self._build_workflow_data(files_data)
         
         # Generate phase-based workflow
         for phase, tasks in workflow_data['phases'].items():
-            workflow_html += f"""
+            yield f"""
                 <div class="workflow-phase">
-                    <div class="phase-header">📋 Phase {phase}</div>"""
+                    <div class="phase-header">📋 Phase {str(phase).translate(_HTML_ESCAPE)}</div>"""
             
             # Group tasks by step within phase
             steps = {}
@@ -329,79 +784,47 @@ class ArchitectureAnalyzer:
             
             for step, step_tasks in sorted(steps.items()):
                 if len(step_tasks) > 1:
-                    workflow_html += f"""
+                    yield f"""
                     <div style="margin-bottom: 15px;">
-                        <strong>Step {step}:</strong>
+                        <strong>Step {str(step).translate(_HTML_ESCAPE)}:</strong>
                         <div class="task-flow">"""
                     
                     for i, task in enumerate(step_tasks):
                         if i > 0:
-                            workflow_html += '<span class="flow-arrow">→</span>'
-                        workflow_html += self._generate_task_node_html(task)
+                            yield '<span class="flow-arrow">→</span>'
+                        yield self._generate_task_node_html(task)
                     
-                    workflow_html += "</div></div>"
+                    yield "</div></div>"
                 else:
                     task = step_tasks[0]
-                    workflow_html += f"""
+                    yield f"""
                     <div style="margin-bottom: 10px;">
-                        <strong>Step {step}:</strong>
+                        <strong>Step {str(step).translate(_HTML_ESCAPE)}:</strong>
                         <div class="task-flow">{self._generate_task_node_html(task)}</div>
                     </div>"""
             
-            workflow_html += "</div>"
+            yield "</div>"
         
         # Show orphaned tasks (tasks without proper connections)
         if workflow_data['orphaned']:
-            workflow_html += """
+            yield """
                 <div class="orphan-tasks">
                     <div class="orphan-header">⚠️ Orphaned Tasks (No Clear Dependencies)</div>
                     <div class="task-flow">"""
             
             for task in workflow_data['orphaned']:
-                workflow_html += self._generate_task_node_html(task)
+                yield self._generate_task_node_html(task)
             
-            workflow_html += "</div></div>"
+            yield "</div></div>"
         
         # Add workflow statistics
-        workflow_html += f"""
-                <div class="workflow-stats">
-                    <h4>📊 Workflow Statistics</h4>
-                    <div class="stats-grid">
-                        <div class="stat-item">
-                            <div class="stat-number">{workflow_data['stats']['total_tasks']}</div>
-                            <div class="stat-label">Total Tasks</div>
-                        </div>
-                        <div class="stat-item">
-                            <div class="stat-number">{workflow_data['stats']['connected_tasks']}</div>
-                            <div class="stat-label">Connected Tasks</div>
-                        </div>
-                        <div class="stat-item">
-                            <div class="stat-number">{workflow_data['stats']['orphaned_tasks']}</div>
-                            <div class="stat-label">Orphaned Tasks</div>
-                        </div>
-                        <div class="stat-item">
-                            <div class="stat-number">{workflow_data['stats']['phases_count']}</div>
-                            <div class="stat-label">Phases</div>
-                        </div>
-                        <div class="stat-item">
-                            <div class="stat-number">{workflow_data['stats']['valid_tasks']}</div>
-                            <div class="stat-label">Valid Tasks</div>
-                        </div>
-                        <div class="stat-item">
-                            <div class="stat-number">{workflow_data['stats']['completion_rate']:.1f}%</div>
-                            <div class="stat-label">Completion Rate</div>
-                        </div>
-                    </div>
-                </div>
-            </div>
-        </div>"""
-        
-        return workflow_html
+        yield _WORKFLOW_STATS_HTML.format_map(workflow_data['stats'])
     
     def _build_workflow_data(self, files_data: List[Dict]) -> Dict:
-        """Build workflow data structure from files."""
-        phases = {}
-        orphaned = []
+        """Build workflow data structure from files in a single pass."""
+        phases = defaultdict(list)
+        task_ids = set()
+        total_tasks = 0
         valid_tasks = 0
         connected_tasks = 0
         
@@ -425,6 +848,9 @@ class ArchitectureAnalyzer:
                 'valid': file_data['yaml_valid']
             }
             
+            total_tasks += 1
+            task_ids.add(task_info['task_id'])
+            
             if task_info['valid']:
                 valid_tasks += 1
             
@@ -433,29 +859,22 @@ class ArchitectureAnalyzer:
                 connected_tasks += 1
             
             # Group by phase
-            phase = task_info['phase']
-            if phase not in phases:
-                phases[phase] = []
-            phases[phase].append(task_info)
-        
-        # Find orphaned tasks (tasks that don't connect properly)
-        all_task_ids = {task['task_id'] for phase_tasks in phases.values() for task in phase_tasks}
-        
-        for phase_tasks in phases.values():
-            for task in phase_tasks:
-                # Check if previous_task and next_task references exist
-                prev_exists = not task['previous_task'] or task['previous_task'] in all_task_ids or task['previous_task'].startswith('PHASE')
-                next_exists = not task['next_task'] or task['next_task'] in all_task_ids or task['next_task'].startswith('P')
-                
-                if not (prev_exists and next_exists):
-                    orphaned.append(task)
+            phases[task_info['phase']].append(task_info)
+        
+        # Find orphaned tasks (references to tasks that don't exist), in phase order
+        orphaned = [
+            task
+            for phase_tasks in phases.values()
+            for task in phase_tasks
+            if not ((not task['previous_task'] or task['previous_task'] in task_ids or task['previous_task'].startswith('PHASE'))
+                    and (not task['next_task'] or task['next_task'] in task_ids or task['next_task'].startswith('P')))
+        ]
         
         # Calculate statistics
-        total_tasks = sum(len(phase_tasks) for phase_tasks in phases.values())
         completion_rate = (valid_tasks / total_tasks * 100) if total_tasks > 0 else 0
         
         return {
-            'phases': phases,
+            'phases': dict(phases),
             'orphaned': orphaned,
             'stats': {
                 'total_tasks': total_tasks,
@@ -469,14 +888,14 @@ class ArchitectureAnalyzer:
     
     def _generate_task_node_html(self, task: Dict) -> str:
         """Generate HTML for a single task node."""
-        status_class = "valid" if task['valid'] else "invalid"
-        status_icon = "✅" if task['valid'] else "❌"
+        status_class = _HTML_STATUS_CLASS[task['valid']]
+        status_icon = _ICON[task['valid']]
         
         return f"""
             <div class="task-node {status_class}">
-                <div class="task-id">{status_icon} {task['task_id']}</div>
-                <div class="task-title">{task['title']}</div>
-                <div class="task-agent">{task['agent']}</div>
+                <div class="task-id">{status_icon} {str(task['task_id']).translate(_HTML_ESCAPE)}</div>
+                <div class="task-title">{str(task['title']).translate(_HTML_ESCAPE)}</div>
+                <div class="task-agent">{str(task['agent']).translate(_HTML_ESCAPE)}</div>
             </div>"""
     
     def wait_for_interrupt(self):
@@ -485,65 +904,134 @@ class ArchitectureAnalyzer:
             self.console.print("\n🔄 [cyan]Analysis complete! HTML file is ready.[/cyan]")
             self.console.print("💡 [yellow]The script will keep running. Press Ctrl+C to stop and clean up.[/yellow]")
             
+            # Block in the kernel until a signal arrives instead of polling
             while True:
-                time.sleep(1)
+                if hasattr(signal, "pause"):
+                    signal.pause()
+                else:
+                    # Windows has no signal.pause(); time.sleep still wakes on Ctrl+C there
+                    time.sleep(3600)
                 
         except KeyboardInterrupt:
             self.console.print("\n\n🛑 [yellow]Interrupt received. Cleaning up...[/yellow]")
             self._cleanup_temp_files()
             self.console.print("✅ [green]Cleanup completed. Goodbye![/green]")
     
-    def extract_yaml_frontmatter(self, content: str) -> tuple[Optional[Dict[str, Any]], List[str]]:
+    @classmethod
+    def extract_yaml_frontmatter(cls, content: str,
+                                 parser_cache: Optional[ParserCache] = None) -> tuple[Optional[Dict[str, Any]], List[str]]:
         """Extract YAML front matter from markdown content."""
         errors = []
         
         # Check if content starts with YAML front matter
-        if not content.strip().startswith('---'):
+        if not _FRONTMATTER_START_RE.match(content):
             return None, ["No YAML front matter found"]
         
         # Find the YAML front matter block
-        yaml_match = re.match(r'^---\s*\n(.*?)\n---\s*\n', content, re.DOTALL)
+        yaml_match = _FRONTMATTER_RE.match(content)
         if not yaml_match:
             return None, ["Invalid YAML front matter format"]
         
-        yaml_content = yaml_match.group(1)
+        return cls.parse_yaml(yaml_match.group(1), parser_cache)
+    
+    @staticmethod
+    def parse_yaml(yaml_content: str,
+                   parser_cache: Optional[ParserCache] = None) -> tuple[Optional[Dict[str, Any]], List[str]]:
+        """Parse an extracted YAML front matter block, consulting the parser cache first."""
+        digest = None
+        if parser_cache is not None:
+            digest = parser_cache.digest(yaml_content)
+            cached = parser_cache.get(digest)
+            if cached is not None:
+                return cached, []
         
         try:
-            yaml_data = yaml.safe_load(yaml_content)
-            return yaml_data, []
+            yaml_data = yaml.load(yaml_content, Loader=SafeLoader)
         except yaml.YAMLError as e:
             return None, [f"YAML parsing error: {str(e)}"]
+        
+        if digest is not None:
+            parser_cache.put(digest, yaml_data)
+        return yaml_data, []
     
-    def extract_headers(self, content: str) -> List[str]:
-        """Extract all ## headers from markdown content."""
-        headers = []
-        lines = content.split('\n')
+    @staticmethod
+    def scan_mapped(mm: mmap.mmap) -> Optional[tuple[Optional[str], List[str], List[str]]]:
+        """Locate front matter and headers in a memory-mapped file without decoding it whole.
         
-        for line in lines:
-            # Match ## headers (level 2)
-            if re.match(r'^##\s+', line):
-                header = line.strip().replace('##', '').strip()
-                headers.append(header)
+        Returns the decoded YAML block (or None with an error), plus the headers,
+        or None when the file is not plain ASCII without CRs and needs the text path.
+        """
+        if _TEXT_PATH_BYTES_RE.search(mm):
+            return None
         
-        return headers
-    
-    def validate_yaml_fields(self, yaml_data: Optional[Dict[str, Any]]) -> List[str]:
-        """Validate required YAML fields."""
-        if not yaml_data:
-            return self.REQUIRED_YAML_FIELDS.copy()
+        found_headers = [match.group(1).decode('utf-8').replace('##', '').strip()
+                         for match in _HEADER_BYTES_RE.finditer(mm)]
         
-        missing_fields = []
-        for field in self.REQUIRED_YAML_FIELDS:
-            if field not in yaml_data or yaml_data[field] is None:
-                missing_fields.append(field)
+        if not _FRONTMATTER_START_BYTES_RE.match(mm):
+            return None, ["No YAML front matter found"], found_headers
+        
+        yaml_match = _FRONTMATTER_BYTES_RE.match(mm)
+        if not yaml_match:
+            return None, ["Invalid YAML front matter format"], found_headers
         
-        return missing_fields
+        return yaml_match.group(1).decode('utf-8'), [], found_headers
+    
+    @staticmethod
+    def _lacks_frontmatter(probe: bytes) -> bool:
+        """Tell from the first bytes of a file that it cannot open with front matter.
+        
+        Only a printable ASCII character is conclusive: other leading bytes may
+        decode to whitespace that the text-level '\\s*---' check skips over.
+        """
+        head = probe.lstrip()
+        return len(head) >= 3 and 0x20 < head[0] < 0x7f and not head.startswith(b'---')
+    
+    @staticmethod
+    def extract_headers(content: str) -> List[str]:
+        """Extract all ## headers from markdown content."""
+        # Scan the whole buffer in C; like the old per-line scan, drop any stray '##' markers
+        return [match.group(1).replace('##', '').strip() for match in _HEADER_RE.finditer(content)]
+    
+    @classmethod
+    def validate_yaml_fields(cls, yaml_data: Optional[Dict[str, Any]]) -> List[str]:
+        """Validate required YAML fields; absent and null fields both count as missing."""
+        return cls._validate_required(yaml_data)
     
-    def analyze_file(self, file_path: Path) -> FileAnalysis:
-        """Analyze a single markdown file."""
+    @classmethod
+    def analyze_file(cls, file_path: Path, cache: Optional[FileCache] = None, headers: bool = True,
+                     parser_cache: Optional[ParserCache] = None) -> FileAnalysis:
+        """Analyze a single markdown file, reusing a cached result when unchanged.
+        
+        Large files are memory-mapped and scanned as bytes. With headers=False
+        only the front matter is needed (the --no-headers mode), so files are
+        never mapped and the body is not read when the front matter fits within
+        the initial probe or the probe already shows there is none.
+        """
+        stat = None
+        if cache is not None:
+            stat, cached = cache.lookup(file_path)
+            if cached is not None:
+                if not headers:
+                    # Front-matter-only analyses report no headers, cached or not
+                    cached.headers = []
+                return cached
+        
+        mapped = None
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
+            with open(file_path, 'rb') as f:
+                if headers and os.fstat(f.fileno()).st_size >= _MMAP_THRESHOLD:
+                    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                        mapped = cls.scan_mapped(mm)
+                if mapped is None:
+                    data = f.read(_PROBE_SIZE)
+                    probe_match = None if headers else _FRONTMATTER_BYTES_RE.match(data)
+                    if probe_match:
+                        data = data[:probe_match.end()]
+                    elif not headers and cls._lacks_frontmatter(data):
+                        data = b''
+                    else:
+                        data += f.read()
+                    content = _decode_text(data)
         except Exception as e:
             return FileAnalysis(
                 filename=file_path.name,
@@ -552,48 +1040,61 @@ class ArchitectureAnalyzer:
                 headers=[],
                 yaml_valid=False,
                 yaml_errors=[f"Error reading file: {str(e)}"],
-                missing_required_fields=self.REQUIRED_YAML_FIELDS.copy()
+                missing_required_fields=list(cls.REQUIRED_YAML_FIELDS)
             )
         
-        # Extract YAML front matter
-        yaml_data, yaml_errors = self.extract_yaml_frontmatter(content)
-        
-        # Extract headers
-        headers = self.extract_headers(content)
+        if mapped is not None:
+            yaml_content, yaml_errors, found_headers = mapped
+            yaml_data = None
+            if yaml_content is not None:
+                yaml_data, yaml_errors = cls.parse_yaml(yaml_content, parser_cache)
+        else:
+            # Extract YAML front matter
+            yaml_data, yaml_errors = cls.extract_yaml_frontmatter(content, parser_cache)
+            
+            # Extract headers
+            found_headers = cls.extract_headers(content) if headers else []
         
         # Validate YAML fields
-        missing_fields = self.validate_yaml_fields(yaml_data)
+        missing_fields = cls.validate_yaml_fields(yaml_data)
         
-        return FileAnalysis(
+        analysis = FileAnalysis(
             filename=file_path.name,
             filepath=str(file_path),
             yaml_frontmatter=yaml_data,
-            headers=headers,
+            headers=found_headers,
             yaml_valid=len(yaml_errors) == 0 and len(missing_fields) == 0,
             yaml_errors=yaml_errors,
             missing_required_fields=missing_fields
         )
+        
+        # Header-less results are partial and must not be served to full analyses
+        if stat is not None and headers:
+            cache.put(file_path, stat, analysis)
+        
+        return analysis
     
     def find_subfolders_with_md(self) -> Dict[str, int]:
         """Find subfolders that contain markdown files."""
         subfolder_counts = {}
-        for subfolder in self.folder_path.iterdir():
-            if subfolder.is_dir():
-                md_count = len(list(subfolder.glob("*.md")))
-                if md_count > 0:
-                    subfolder_counts[subfolder.name] = md_count
+        with os.scandir(self.folder_path) as entries:
+            for entry in entries:
+                if entry.is_dir():
+                    md_count = _count_md(entry.path)
+                    if md_count > 0:
+                        subfolder_counts[entry.name] = md_count
         return subfolder_counts
     
     def analyze_folder(self) -> None:
         """Analyze all markdown files in the folder."""
-        self.console.print(f"\n🔍 Analyzing folder: [bold blue]{self.folder_path}[/bold blue]")
+        if not self._headless:
+            self.console.print(f"\n🔍 Analyzing folder: [bold blue]{self.folder_path}[/bold blue]")
+        self._export_data.clear()
         
-        # Find all markdown files
-        if self.recursive:
-            md_files = list(self.folder_path.rglob("*.md"))
+        # Find all markdown files; only matches are turned into Path objects
+        md_files = [Path(p) for p in _walk_md(str(self.folder_path), self.recursive)]
+        if self.recursive and not self._headless:
             self.console.print(f"Recursive search enabled")
-        else:
-            md_files = list(self.folder_path.glob("*.md"))
         
         if not md_files:
             self.console.print("[yellow]No markdown files found in the specified folder.[/yellow]")
@@ -617,30 +1118,70 @@ class ArchitectureAnalyzer:
                 self.display_folder_structure()
             return
         
-        self.console.print(f"Found {len(md_files)} markdown files")
-        if self.recursive:
-            # Group files by their parent directory
-            files_by_dir = {}
-            for file_path in sorted(md_files):
-                parent_dir = file_path.parent
-                if parent_dir not in files_by_dir:
-                    files_by_dir[parent_dir] = []
-                files_by_dir[parent_dir].append(file_path)
-            
-            self.console.print(f"Files distributed across {len(files_by_dir)} directories")
-        
-        # Analyze each file
-        for file_path in sorted(md_files):
-            analysis = self.analyze_file(file_path)
-            self.files_analysis.append(analysis)
+        if not self._headless:
+            self.console.print(f"Found {len(md_files)} markdown files")
+            if self.recursive:
+                # Only the number of distinct parent directories is reported
+                parent_dirs = {os.path.dirname(path) for path in map(str, md_files)}
+                self.console.print(f"Files distributed across {len(parent_dirs)} directories")
+        
+        # Analyze files in parallel; map() keeps results in sorted input order
+        md_files = sorted(md_files)
+        if self.use_processes:
+            self.files_analysis = self._analyze_in_processes(md_files)
+        else:
+            max_workers = self.workers or min(32, (os.cpu_count() or 1) * 4)
+            worker = partial(_analyze_file_worker, cache=self.file_cache, parser_cache=self.parser_cache,
+                             headers=self.include_headers)
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                self.files_analysis = list(executor.map(worker, md_files))
+        
+        if self.file_cache is not None:
+            self.file_cache.save()
+        if self.parser_cache is not None:
+            self.parser_cache.save()
+    
+    def _analyze_in_processes(self, md_files: List[Path]) -> List[FileAnalysis]:
+        """Analyze files in worker processes so YAML parsing is not bound by the GIL.
+        
+        Caches cannot be shared with the workers, so the file cache is consulted
+        and updated here in the parent and only changed files are dispatched.
+        """
+        results: List[Optional[FileAnalysis]] = [None] * len(md_files)
+        stats: List[Optional[os.stat_result]] = [None] * len(md_files)
+        if self.file_cache is not None:
+            for index, file_path in enumerate(md_files):
+                stats[index], results[index] = self.file_cache.lookup(file_path)
+                if results[index] is not None and not self.include_headers:
+                    results[index].headers = []
+        
+        pending = [index for index, analysis in enumerate(results) if analysis is None]
+        if pending:
+            # None lets the executor pick its default, which respects the Windows cap of 61
+            with ProcessPoolExecutor(max_workers=self.workers) as executor:
+                worker = partial(_analyze_file_worker, headers=self.include_headers)
+                analyses = executor.map(worker, [md_files[index] for index in pending], chunksize=32)
+                for index, analysis in zip(pending, analyses):
+                    results[index] = analysis
+                    # Header-less results are partial and must not be served to full analyses
+                    if stats[index] is not None and self.include_headers:
+                        self.file_cache.put(md_files[index], stats[index], analysis)
+        
+        return results
     
     def display_folder_structure(self) -> None:
         """Display the folder structure when no markdown files are found."""
+        from rich.tree import Tree
+        
         tree = Tree(f"📁 [bold blue]{self.folder_path.name}[/bold blue] (Folder Structure)")
         
-        for item in sorted(self.folder_path.iterdir()):
+        # DirEntry types come from readdir, so listing costs no stat per entry
+        with os.scandir(self.folder_path) as entries:
+            items = sorted(entries, key=lambda entry: entry.name)
+        
+        for item in items:
             if item.is_dir():
-                md_count = len(list(item.glob("*.md")))
+                md_count = _count_md(item.path)
                 if md_count > 0:
                     tree.add(f"📁 [green]{item.name}[/green] ({md_count} markdown files)")
                 else:
@@ -652,6 +1193,8 @@ class ArchitectureAnalyzer:
     
     def display_architecture(self) -> None:
         """Display the folder architecture analysis."""
+        from rich.tree import Tree
+        
         if not self.files_analysis:
             self.console.print("[red]No files analyzed.[/red]")
             return
@@ -661,17 +1204,17 @@ class ArchitectureAnalyzer:
         
         if self.recursive:
             # Group files by directory for recursive display
-            files_by_dir = {}
+            # Plain string paths avoid building a Path per file just to take its parent
+            files_by_dir = defaultdict(list)
             for analysis in self.files_analysis:
-                file_path = Path(analysis.filepath)
-                parent_dir = file_path.parent
-                if parent_dir not in files_by_dir:
-                    files_by_dir[parent_dir] = []
-                files_by_dir[parent_dir].append(analysis)
+                files_by_dir[os.path.dirname(analysis.filepath)].append(analysis)
             
-            # Display each directory as a branch
-            for dir_path, analyses in sorted(files_by_dir.items()):
-                relative_path = dir_path.relative_to(self.folder_path)
+            # Display each directory as a branch, ordered by path components like pathlib;
+            # files directly under a '.' root have an empty dirname, which has no components
+            root = str(self.folder_path)
+            for dir_path, analyses in sorted(files_by_dir.items(),
+                                             key=lambda item: item[0].split(os.sep) if item[0] else []):
+                relative_path = os.path.relpath(dir_path or os.curdir, root)
                 dir_node = tree.add(f"📁 [cyan]{relative_path}[/cyan]")
                 
                 for analysis in analyses:
@@ -684,8 +1227,24 @@ class ArchitectureAnalyzer:
         self.console.print(tree)
     
     def _add_file_node(self, parent_node, analysis: FileAnalysis):
-        """Add a file node to the tree."""
-        file_status = "✅" if analysis.yaml_valid else "❌"
+        """Add a file node to the tree.
+        
+        Outside verbose mode each file is a single node carrying its counts and
+        any problems; the per-field and per-header branches are verbose-only.
+        """
+        file_status = _ICON[analysis.yaml_valid]
+        if not self.verbose:
+            frontmatter = analysis.yaml_frontmatter
+            field_count = len(frontmatter) if isinstance(frontmatter, dict) else 0
+            label = (f"{file_status} [bold]{analysis.filename}[/bold] "
+                     f"[dim]({field_count} fields, {len(analysis.headers)} headers)[/dim]")
+            if analysis.missing_required_fields:
+                label += f"\n❌ [red]Missing Required Fields:[/red] {', '.join(analysis.missing_required_fields)}"
+            if analysis.yaml_errors:
+                label += f"\n⚠️ [red]YAML Errors:[/red] {'; '.join(analysis.yaml_errors)}"
+            parent_node.add(label)
+            return
+        
         file_node = parent_node.add(f"{file_status} [bold]{analysis.filename}[/bold]")
         
         # YAML Front Matter section
@@ -693,7 +1252,7 @@ class ArchitectureAnalyzer:
         
         if analysis.yaml_frontmatter:
             for key, value in analysis.yaml_frontmatter.items():
-                status = "✅" if key in self.REQUIRED_YAML_FIELDS else "ℹ️"
+                status = _FIELD_ICON[key in self._REQUIRED_SET]
                 yaml_node.add(f"{status} [green]{key}[/green]: {value}")
         
         # Missing fields
@@ -718,6 +1277,8 @@ class ArchitectureAnalyzer:
     
     def display_summary_table(self) -> None:
         """Display a summary table of the analysis."""
+        from rich.table import Table
+        
         table = Table(title="📊 Analysis Summary")
         
         table.add_column("File", style="cyan", no_wrap=True)
@@ -727,10 +1288,10 @@ class ArchitectureAnalyzer:
         table.add_column("Status", justify="center")
         
         for analysis in self.files_analysis:
-            yaml_status = "✅" if analysis.yaml_valid else "❌"
+            yaml_status = _ICON[analysis.yaml_valid]
             headers_count = str(len(analysis.headers))
             missing_count = str(len(analysis.missing_required_fields))
-            overall_status = "✅ Valid" if analysis.yaml_valid else "❌ Issues"
+            overall_status = _STATUS[analysis.yaml_valid]
             
             table.add_row(
                 analysis.filename,
@@ -744,6 +1305,8 @@ class ArchitectureAnalyzer:
     
     def display_validation_details(self) -> None:
         """Display detailed validation information."""
+        from rich.panel import Panel
+        
         self.console.print("\n📋 [bold]YAML Front Matter Validation Details[/bold]")
         
         for analysis in self.files_analysis:
@@ -769,45 +1332,98 @@ class ArchitectureAnalyzer:
                     )
                     self.console.print(panel)
     
-    def get_export_data(self) -> Dict[str, Any]:
-        """Prepare data for export."""
-        return {
+    def get_export_data(self, files_as_dicts: bool = True) -> Dict[str, Any]:
+        """Prepare data for export.
+        
+        With files_as_dicts=False the FileAnalysis objects are passed through
+        as-is for encoders that serialize dataclasses natively. Each variant
+        is built once and shared by every exporter until the next analysis.
+        """
+        cached = self._export_data.get(files_as_dicts)
+        if cached is not None:
+            return cached
+        
+        # Gather every aggregate in a single pass over the analyses
+        valid_files = total_headers = 0
+        files_with_errors = []
+        files_missing_fields = []
+        for analysis in self.files_analysis:
+            valid_files += analysis.yaml_valid
+            total_headers += len(analysis.headers)
+            if analysis.yaml_errors:
+                files_with_errors.append(analysis.filename)
+            if analysis.missing_required_fields:
+                files_missing_fields.append(analysis.filename)
+        total_files = len(self.files_analysis)
+        
+        self._export_data[files_as_dicts] = data = {
             "analysis_metadata": {
                 "timestamp": self.analysis_timestamp.isoformat(),
                 "folder_path": str(self.folder_path),
                 "recursive": self.recursive,
-                "total_files": len(self.files_analysis),
-                "valid_files": sum(1 for analysis in self.files_analysis if analysis.yaml_valid),
-                "invalid_files": sum(1 for analysis in self.files_analysis if not analysis.yaml_valid)
+                "total_files": total_files,
+                "valid_files": valid_files,
+                "invalid_files": total_files - valid_files
             },
-            "files": [asdict(analysis) for analysis in self.files_analysis],
+            "files": [asdict(analysis) for analysis in self.files_analysis] if files_as_dicts else list(self.files_analysis),
             "summary": {
-                "required_yaml_fields": self.REQUIRED_YAML_FIELDS,
-                "total_headers": sum(len(analysis.headers) for analysis in self.files_analysis),
-                "files_with_errors": [analysis.filename for analysis in self.files_analysis if analysis.yaml_errors],
-                "files_missing_fields": [analysis.filename for analysis in self.files_analysis if analysis.missing_required_fields]
+                "required_yaml_fields": list(self.REQUIRED_YAML_FIELDS),
+                "total_headers": total_headers,
+                "files_with_errors": files_with_errors,
+                "files_missing_fields": files_missing_fields
             }
         }
+        return data
     
     def export_to_json(self) -> str:
         """Export analysis results to JSON format."""
-        data = self.get_export_data()
-        timestamp = self.analysis_timestamp.strftime("%Y%m%d_%H%M%S")
-        filename = f"architecture_analysis_{timestamp}.json"
+        filename = f"architecture_analysis_{self._ts_str}.json"
         filepath = self.output_dir / filename
         
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+        # Records are encoded one at a time, so no full tree of dicts is built
+        data = self.get_export_data(files_as_dicts=False)
+        pretty = self.pretty_json
+        # Skeleton whitespace matching indent=2 output, or none for the compact form
+        newline, indent, colon = (b'\n', b'  ', b': ') if pretty else (b'', b'', b':')
+        with open(filepath, 'wb', buffering=65536) as f:
+            f.write(b'{' + newline + indent + b'"analysis_metadata"' + colon)
+            f.write(self._encode_json(data['analysis_metadata'], 1, pretty))
+            f.write(b',' + newline + indent + b'"files"' + colon + b'[')
+            for index, analysis in enumerate(data['files']):
+                f.write((b',' if index else b'') + newline + indent * 2)
+                # orjson serializes the dataclasses directly, skipping asdict()
+                f.write(self._encode_json(analysis if orjson is not None else asdict(analysis), 2, pretty))
+            f.write(newline + indent + b']' if data['files'] else b']')
+            f.write(b',' + newline + indent + b'"summary"' + colon)
+            f.write(self._encode_json(data['summary'], 1, pretty))
+            f.write(newline + b'}')
         
         return str(filepath)
     
+    @staticmethod
+    def _encode_json(value: Any, level: int, pretty: bool = True) -> bytes:
+        """Encode a value as JSON nested `level` levels deep in the document.
+        
+        Pretty output is indented to match its depth; compact output has no
+        whitespace at all and needs no re-indenting.
+        """
+        if not pretty:
+            if orjson is not None:
+                return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS)
+            return json.dumps(value, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+        if orjson is not None:
+            chunk = orjson.dumps(value, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+        else:
+            chunk = json.dumps(value, indent=2, ensure_ascii=False).encode('utf-8')
+        # Newlines only occur between tokens (string newlines are escaped), so re-indent them
+        return chunk.replace(b'\n', b'\n' + b'  ' * level)
+    
     def export_to_csv(self) -> str:
         """Export analysis results to CSV format."""
-        timestamp = self.analysis_timestamp.strftime("%Y%m%d_%H%M%S")
-        filename = f"architecture_analysis_{timestamp}.csv"
+        filename = f"architecture_analysis_{self._ts_str}.csv"
         filepath = self.output_dir / filename
         
-        with open(filepath, 'w', newline='', encoding='utf-8') as f:
+        with open(filepath, 'w', newline='', encoding='utf-8', buffering=65536) as f:
             writer = csv.writer(f)
             
             # Write headers
@@ -817,9 +1433,9 @@ class ArchitectureAnalyzer:
                 'Missing_Fields', 'YAML_Errors'
             ])
             
-            # Write data
-            for analysis in self.files_analysis:
-                writer.writerow([
+            # Write data; writerows drains the generator in C, one row at a time
+            writer.writerows(
+                (
                     analysis.filename,
                     analysis.filepath,
                     analysis.yaml_valid,
@@ -829,134 +1445,83 @@ class ArchitectureAnalyzer:
                     '; '.join(analysis.headers),
                     '; '.join(analysis.missing_required_fields),
                     '; '.join(analysis.yaml_errors)
-                ])
+                )
+                for analysis in self.files_analysis
+            )
         
         return str(filepath)
     
     def export_to_html(self) -> str:
         """Export analysis results to HTML format."""
-        timestamp = self.analysis_timestamp.strftime("%Y%m%d_%H%M%S")
-        filename = f"architecture_analysis_{timestamp}.html"
+        filename = f"architecture_analysis_{self._ts_str}.html"
         filepath = self.output_dir / filename
         
-        data = self.get_export_data()
+        # Rows are rendered from the FileAnalysis objects, so no per-file dicts are needed
+        data = self.get_export_data(files_as_dicts=False)
         
-        html_content = f"""<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>Architecture Analysis Report</title>
-    <style>
-        body {{ font-family: Arial, sans-serif; margin: 20px; background-color: #f5f5f5; }}
-        .container {{ max-width: 1200px; margin: 0 auto; background: white; padding: 20px; border-radius: 8px; box-shadow: 0 2px 10px rgba(0,0,0,0.1); }}
-        h1, h2, h3 {{ color: #333; }}
-        .metadata {{ background: #e8f4fd; padding: 15px; border-radius: 5px; margin-bottom: 20px; }}
-        .summary {{ background: #f0f8f0; padding: 15px; border-radius: 5px; margin-bottom: 20px; }}
-        table {{ width: 100%; border-collapse: collapse; margin-bottom: 20px; }}
-        th, td {{ border: 1px solid #ddd; padding: 8px; text-align: left; }}
-        th {{ background-color: #f2f2f2; font-weight: bold; }}
-        .valid {{ color: #28a745; }}
-        .invalid {{ color: #dc3545; }}
-        .file-details {{ margin-bottom: 20px; padding: 15px; border: 1px solid #ddd; border-radius: 5px; }}
-        .headers {{ background: #fff3cd; padding: 10px; border-radius: 3px; }}
-        .errors {{ background: #f8d7da; padding: 10px; border-radius: 3px; }}
-        .missing {{ background: #f8d7da; padding: 10px; border-radius: 3px; }}
-    </style>
-</head>
-<body>
-    <div class="container">
-        <h1>📊 Architecture Analysis Report</h1>
-        
-        <div class="metadata">
-            <h2>📋 Analysis Metadata</h2>
-            <p><strong>Timestamp:</strong> {data['analysis_metadata']['timestamp']}</p>
-            <p><strong>Folder Path:</strong> {data['analysis_metadata']['folder_path']}</p>
-            <p><strong>Recursive Analysis:</strong> {data['analysis_metadata']['recursive']}</p>
-            <p><strong>Total Files:</strong> {data['analysis_metadata']['total_files']}</p>
-        </div>
+        with open(filepath, 'w', encoding='utf-8', buffering=65536) as f:
+            self._write_html_report(f, data)
         
-        <div class="summary">
-            <h2>📈 Summary</h2>
-            <p><strong>Valid Files:</strong> <span class="valid">{data['analysis_metadata']['valid_files']}</span></p>
-            <p><strong>Invalid Files:</strong> <span class="invalid">{data['analysis_metadata']['invalid_files']}</span></p>
-            <p><strong>Success Rate:</strong> {(data['analysis_metadata']['valid_files']/data['analysis_metadata']['total_files']*100):.1f}%</p>
-            <p><strong>Total Headers:</strong> {data['summary']['total_headers']}</p>
-        </div>
-        
-        <h2>📁 Files Analysis</h2>
-        <table>
-            <thead>
-                <tr>
-                    <th>File</th>
-                    <th>Status</th>
-                    <th>Headers</th>
-                    <th>Missing Fields</th>
-                    <th>Errors</th>
-                </tr>
-            </thead>
-            <tbody>"""
+        return str(filepath)
+    
+    def _write_html_report(self, f, data: Dict[str, Any]) -> None:
+        """Stream the static HTML report to an open text file."""
+        metadata = data['analysis_metadata']
+        f.write(_REPORT_HTML_HEAD.format(
+            timestamp=metadata['timestamp'],
+            folder_path=metadata['folder_path'].translate(_HTML_ESCAPE),
+            recursive=metadata['recursive'],
+            total_files=metadata['total_files'],
+            valid_files=metadata['valid_files'],
+            invalid_files=metadata['invalid_files'],
+            success_rate=metadata['valid_files'] / metadata['total_files'] * 100,
+            total_headers=data['summary']['total_headers']
+        ))
         
         for analysis in self.files_analysis:
-            status_class = "valid" if analysis.yaml_valid else "invalid"
-            status_text = "✅ Valid" if analysis.yaml_valid else "❌ Invalid"
-            
-            html_content += f"""
-                <tr>
-                    <td>{analysis.filename}</td>
-                    <td class="{status_class}">{status_text}</td>
-                    <td>{len(analysis.headers)}</td>
-                    <td>{len(analysis.missing_required_fields)}</td>
-                    <td>{len(analysis.yaml_errors)}</td>
-                </tr>"""
+            f.write(_SUMMARY_ROW_HTML.format(
+                filename=analysis.filename.translate(_HTML_ESCAPE),
+                status_class=_HTML_STATUS_CLASS[analysis.yaml_valid],
+                status_icon=_HTML_STATUS[analysis.yaml_valid],
+                headers=len(analysis.headers),
+                missing=len(analysis.missing_required_fields),
+                errors=len(analysis.yaml_errors)
+            ))
         
-        html_content += """
-            </tbody>
-        </table>
-        
-        <h2>📝 Detailed File Analysis</h2>"""
+        f.write(_REPORT_DETAILS_HEAD)
         
         for analysis in self.files_analysis:
-            html_content += f"""
-        <div class="file-details">
-            <h3>📄 {analysis.filename}</h3>
-            <p><strong>Path:</strong> {analysis.filepath}</p>
-            <p><strong>YAML Valid:</strong> <span class="{'valid' if analysis.yaml_valid else 'invalid'}">{'✅ Yes' if analysis.yaml_valid else '❌ No'}</span></p>"""
+            f.write(_REPORT_FILE_HTML.format(
+                filename=analysis.filename.translate(_HTML_ESCAPE),
+                filepath=analysis.filepath.translate(_HTML_ESCAPE),
+                status_class=_HTML_STATUS_CLASS[analysis.yaml_valid],
+                status_text=_HTML_VALID_TEXT[analysis.yaml_valid]
+            ))
             
             if analysis.headers:
-                html_content += f"""
-            <div class="headers">
-                <h4>📝 Headers ({len(analysis.headers)})</h4>
-                <ul>{''.join(f'<li>{header}</li>' for header in analysis.headers)}</ul>
-            </div>"""
+                f.write(self._html_list("headers", "📝 Headers", analysis.headers))
             else:
-                html_content += "<p>No headers found</p>"
+                f.write("<p>No headers found</p>")
             
             if analysis.missing_required_fields:
-                html_content += f"""
-            <div class="missing">
-                <h4>❌ Missing Required Fields ({len(analysis.missing_required_fields)})</h4>
-                <ul>{''.join(f'<li>{field}</li>' for field in analysis.missing_required_fields)}</ul>
-            </div>"""
+                f.write(self._html_list("missing", "❌ Missing Required Fields", analysis.missing_required_fields))
             
             if analysis.yaml_errors:
-                html_content += f"""
-            <div class="errors">
-                <h4>⚠️ YAML Errors ({len(analysis.yaml_errors)})</h4>
-                <ul>{''.join(f'<li>{error}</li>' for error in analysis.yaml_errors)}</ul>
-            </div>"""
+                f.write(self._html_list("errors", "⚠️ YAML Errors", analysis.yaml_errors))
             
-            html_content += "</div>"
+            f.write("</div>")
         
-        html_content += """
-    </div>
-</body>
-</html>"""
-        
-        with open(filepath, 'w', encoding='utf-8') as f:
-            f.write(html_content)
-        
-        return str(filepath)
+        f.write(_REPORT_HTML_TAIL)
+    
+    @staticmethod
+    def _html_list(css_class: str, title: str, items: List[str]) -> str:
+        """Render one titled, escaped bullet list of the static report."""
+        return _REPORT_LIST_HTML.format(
+            css_class=css_class,
+            title=title,
+            count=len(items),
+            items="".join(f"<li>{item.translate(_HTML_ESCAPE)}</li>" for item in items)
+        )
     
     def export_results(self) -> List[str]:
         """Export results in the specified format(s)."""
@@ -977,10 +1542,10 @@ class ArchitectureAnalyzer:
                     filepath = self.export_to_html()
                 
                 exported_files.append(filepath)
-                self.console.print(f"✅ Exported {fmt.upper()}: [green]{filepath}[/green]")
+                self._print_status(f"✅ Exported {fmt.upper()}: [green]{filepath}[/green]")
             
             except Exception as e:
-                self.console.print(f"❌ Failed to export {fmt.upper()}: [red]{e}[/red]")
+                self._print_status(f"❌ Failed to export {fmt.upper()}: [red]{e}[/red]")
         
         return exported_files
 
@@ -991,26 +1556,29 @@ class ArchitectureAnalyzer:
         if not self.files_analysis:
             return
         
-        # Display results
-        self.display_architecture()
-        self.console.print("\n")
-        self.display_summary_table()
-        self.display_validation_details()
+        # Display results; when exporting from a pipe or CI job nobody reads the
+        # per-file renderings, so they are skipped there unless --verbose is set
+        if self._is_tty or self.verbose or not (self.export_format or self.export_html):
+            self.display_architecture()
+            self.console.print("\n")
+            self.display_summary_table()
+            self.display_validation_details()
         
         # Final summary
-        valid_files = sum(1 for analysis in self.files_analysis if analysis.yaml_valid)
-        total_files = len(self.files_analysis)
+        metadata = self.get_export_data(files_as_dicts=False)['analysis_metadata']
+        valid_files = metadata['valid_files']
+        total_files = metadata['total_files']
         
-        self.console.print(f"\n🎯 [bold]Final Summary:[/bold]")
-        self.console.print(f"   Valid files: {valid_files}/{total_files}")
-        self.console.print(f"   Success rate: {(valid_files/total_files)*100:.1f}%")
+        self._print_status(f"\n🎯 [bold]Final Summary:[/bold]")
+        self._print_status(f"   Valid files: {valid_files}/{total_files}")
+        self._print_status(f"   Success rate: {(valid_files/total_files)*100:.1f}%")
         
         # Export if requested
         if self.export_format:
-            self.console.print(f"\\n📤 [bold]Exporting Results...[/bold]")
+            self._print_status(f"\\n📤 [bold]Exporting Results...[/bold]")
             exported_files = self.export_results()
             if exported_files:
-                self.console.print(f"\\n✅ [green]Export completed! Files saved to: {self.output_dir}[/green]")
+                self._print_status(f"\\n✅ [green]Export completed! Files saved to: {self.output_dir}[/green]")
         
         # Handle interactive HTML export
         if self.export_html:
@@ -1033,8 +1601,15 @@ class ArchitectureAnalyzer:
                 # Try to open automatically
                 try:
                     import subprocess
-                    # Try to open with default browser
-                    subprocess.run(['xdg-open', html_file], check=False, capture_output=True)
+                    # Try to open with default browser; detached, so we never wait on xdg-open,
+                    # but reaped on SIGCHLD so it does not linger as a zombie while we wait
+                    if hasattr(signal, "SIGCHLD"):
+                        signal.signal(signal.SIGCHLD, self._reap_opener)
+                    self._opener = subprocess.Popen(['xdg-open', html_file], stdin=subprocess.DEVNULL,
+                                                    stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+                                                    start_new_session=True)
+                    # It may have exited before the handle was stored
+                    self._reap_opener()
                     self.console.print(f"\\n🚀 [green]Attempting to open in default browser...[/green]")
                 except:
                     pass
@@ -1057,7 +1632,7 @@ def main():
     parser.add_argument(
         "--verbose", "-v",
         action="store_true",
-        help="Enable verbose output"
+        help="Enable verbose output (full front matter and headers in the tree view)"
     )
     parser.add_argument(
         "--recursive", "-r",
@@ -1079,16 +1654,44 @@ def main():
         default="./exports",
         help="Output directory for exported files (default: ./exports)"
     )
+    parser.add_argument(
+        "--pretty-json",
+        action="store_true",
+        help="Indent the JSON export for reading (default: compact)"
+    )
     parser.add_argument(
         "--export-html",
         action="store_true",
         help="Export to HTML and open in browser, keep running until Ctrl+C (auto-cleanup)"
     )
+    parser.add_argument(
+        "--no-headers",
+        action="store_true",
+        help="Only validate YAML front matter; skip ## header extraction (reads just the start of each file)"
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Ignore and do not update the on-disk analysis caches"
+    )
+    parser.add_argument(
+        "--workers", "-w",
+        type=int,
+        help="Number of files read and parsed concurrently (default: 4 per CPU, at most 32; "
+             "one per CPU with --processes)"
+    )
+    parser.add_argument(
+        "--processes", "-p",
+        action="store_true",
+        help="Parse files in worker processes instead of threads (faster on very large trees)"
+    )
     
     args = parser.parse_args()
+    if args.workers is not None and args.workers < 1:
+        parser.error("--workers must be at least 1")
     
     try:
-        analyzer = ArchitectureAnalyzer(args.folder_path, args.recursive, args.show_structure, args.export, args.output_dir, args.export_html)
+        analyzer = ArchitectureAnalyzer(args.folder_path, args.recursive, args.show_structure, args.export, args.output_dir, args.export_html, not args.no_cache, args.workers, args.processes, args.verbose, args.pretty_json, not args.no_headers)
         analyzer.run_analysis()
     except (FileNotFoundError, NotADirectoryError) as e:
         print(f"Error: {e}", file=sys.stderr)
@@ -43,12 +43,17 @@ if [ $# -eq 0 ]; then
     echo "  $0 \"path/to/folder\" --export-html"
     echo ""
     echo "Options:"
-    echo "  --verbose, -v         Enable verbose output"
+    echo "  --verbose, -v         Show full front matter and headers in the tree view"
     echo "  --recursive, -r       Recursively analyze all subfolders"
     echo "  --show-structure, -s  Show folder structure even when no markdown files found"
     echo "  --export, -e          Export results (json|csv|html|all)"
     echo "  --output-dir, -o      Output directory for exported files"
+    echo "  --pretty-json         Indent the JSON export (default: compact)"
     echo "  --export-html         Interactive HTML export (keeps running, auto-cleanup on Ctrl+C)"
+    echo "  --no-headers          Only validate YAML front matter, skip ## header extraction"
+    echo "  --no-cache            Ignore and do not update the on-disk analysis caches"
+    echo "  --workers, -w         Number of files read and parsed concurrently"
+    echo "  --processes, -p       Parse files in worker processes instead of threads"
     echo "  --help, -h            Show this help message"
     exit 1
 fi